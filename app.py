@@ -1,12 +1,12 @@
 from flask import Flask, jsonify, render_template, request
 from state import ResumeState
+from services import llm_service
 from services.llm_service import classify_intent, extract_resume_data, modify_resume_data, refine_resume_data
-import torch
 import os
 import uuid
+import threading
 import traceback
 import subprocess
-from transformers import pipeline
 import time
 import random
 import re
@@ -17,8 +17,13 @@ resume_state = ResumeState()
 UPLOAD_FOLDER = "uploads"
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
-# Lazy-loaded Whisper model
+# Lazy-loaded Whisper model (torch/transformers are imported on first use)
 whisper_asr = None
+_model_lock = threading.Lock()
+
+# Background warm-up thread, started at most once per process
+_warmup_thread = None
+_warmup_lock = threading.Lock()
 
 FALLBACK_SKILLS = [
     "Python",
@@ -205,29 +210,59 @@ def get_model():
     global whisper_asr
 
     if whisper_asr is None:
-        print("=" * 50)
-        print("Loading Whisper Large-v3 model...")
+        with _model_lock:
+            if whisper_asr is not None:
+                return whisper_asr
 
-        if torch.cuda.is_available():
-            print("GPU:", torch.cuda.get_device_name(0))
-            device = 0
-        else:
-            print("Using CPU (slower)")
-            device = -1
-
-        whisper_asr = pipeline(
-            "automatic-speech-recognition",
-            model="openai/whisper-large-v3",
-            device=device,
-            torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32
-        )
+            import torch
+            from transformers import pipeline
 
-        print("Model loaded successfully!")
-        print("=" * 50)
+            print("=" * 50)
+            print("Loading Whisper Large-v3 model...")
+
+            if torch.cuda.is_available():
+                print("GPU:", torch.cuda.get_device_name(0))
+                device = 0
+            else:
+                print("Using CPU (slower)")
+                device = -1
+
+            whisper_asr = pipeline(
+                "automatic-speech-recognition",
+                model="openai/whisper-large-v3",
+                device=device,
+                torch_dtype=torch.float16 if torch.cuda.is_available() else torch.float32
+            )
+
+            print("Model loaded successfully!")
+            print("=" * 50)
 
     return whisper_asr
 
 
+def start_warmup():
+    """Load the Whisper model and Groq client on a background thread (once per process)."""
+    global _warmup_thread
+
+    def warm():
+        try:
+            get_model()
+        except Exception:
+            traceback.print_exc()
+
+        try:
+            llm_service.warm_up()
+        except Exception:
+            traceback.print_exc()
+
+    with _warmup_lock:
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(target=warm, name="vars-warmup", daemon=True)
+            _warmup_thread.start()
+
+    return _warmup_thread
+
+
 @app.route("/")
 def index():
     return render_template("index.html", resume_generated=resume_state.is_resume_generated())
@@ -402,5 +437,10 @@ def save_resume():
     return jsonify({"message": "Resume saved.", "data": resume_state.get_resume_data()})
 
 
+# Runs on import so WSGI workers (gunicorn, waitress) warm up too, not only `python app.py`.
+if os.environ.get("VARS_WARMUP", "").lower() in {"1", "true", "yes"}:
+    start_warmup()
+
+
 if __name__ == "__main__":
     app.run(debug=True, use_reloader=False)
\ No newline at end of file
@@ -0,0 +1,413 @@
+"""
+Load test for the VARS Flask app with stubbed ASR and LLM backends.
+
+Replays recorded `.webm` fixtures and a transcript corpus through
+`/transcribe` → `/process-transcript` → `/generate-resume` for N concurrent
+simulated users, then reports throughput, p50/p95/p99 latency per stage and
+peak memory.
+
+The app keeps a single module-level `resume_state`, so the simulated users
+share one resume session: the run measures N clients interleaving edits on
+the same resume, not N isolated users. The state is reset before each run so
+results do not depend on earlier requests in the process, and each user's
+first transcript is an "add" so later "modify" transcripts always find data.
+
+Each user's first `--warmup` iterations (template compilation, first-use
+imports) are excluded from the samples; all users finish warming up before
+the measured phase starts. Stub latencies are drawn from a per-user RNG
+seeded with `--seed + user_id`, so runs with the same settings are
+comparable.
+
+Only 2xx/3xx responses enter the latency samples. 4xx responses are counted
+as rejected, and 5xx responses or raised exceptions as errors. Memory is
+reported as the growth of peak RSS during the measured phase (so import-time
+footprint is excluded) and, with `--trace-memory`, the tracemalloc peak.
+
+Run from the repository root:
+
+    python -m benchmarks.load_test --users 8 --iterations 5
+    python -m benchmarks.load_test --save bench.json
+    python -m benchmarks.load_test --baseline bench.json --tolerance 0.25
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Never warm the real Whisper/Groq backends; the stubs replace them.
+os.environ["VARS_WARMUP"] = "0"
+
+import app as vars_app  # noqa: E402
+from state import ResumeState  # noqa: E402
+
+from benchmarks.stubs import StubASR, StubLLM, install  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TRANSCRIPTS = os.path.join(BENCH_DIR, "fixtures", "transcripts.json")
+DEFAULT_AUDIO_GLOB = os.path.join(BENCH_DIR, "fixtures", "audio", "*.webm")
+
+STAGES = ("transcribe", "process-transcript", "generate-resume")
+
+# Settings that must match for two reports to be comparable.
+CONFIG_KEYS = (
+    "users", "iterations", "warmup", "asr_latency", "llm_latency", "jitter", "seed", "audio_fixtures",
+)
+
+# Absolute allowance on top of the relative tolerance, so tiny memory figures
+# (a few hundred KiB of RSS growth) do not trip the gate.
+MEMORY_SLACK_MB = 1.0
+
+
+# ── Metrics ───────────────────────────────────────────────────────────────────
+
+class StageRecorder:
+    """Thread-safe per-stage latencies plus rejected (4xx) and error counts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {stage: [] for stage in STAGES}
+        self.rejected = {stage: 0 for stage in STAGES}
+        self.errors = {stage: 0 for stage in STAGES}
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self.latencies[stage].append(seconds)
+
+    def reject(self, stage: str):
+        with self._lock:
+            self.rejected[stage] += 1
+
+    def fail(self, stage: str):
+        with self._lock:
+            self.errors[stage] += 1
+
+    def requests(self, stage: str) -> int:
+        return len(self.latencies[stage]) + self.rejected[stage] + self.errors[stage]
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty sample."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return peak / divisor
+
+
+# ── Simulated users ───────────────────────────────────────────────────────────
+
+def _timed(recorder: StageRecorder, stage: str, call):
+    start = time.perf_counter()
+    try:
+        response = call()
+    except Exception as exc:
+        # stdout may be redirected while the run is quiet; errors go to stderr.
+        print(f"{stage}: {type(exc).__name__}: {exc}", file=sys.stderr)
+        recorder.fail(stage)
+        return
+    elapsed = time.perf_counter() - start
+
+    if response.status_code >= 500:
+        recorder.fail(stage)
+    elif response.status_code >= 400:
+        recorder.reject(stage)
+    else:
+        recorder.record(stage, elapsed)
+
+
+def _audio_upload(path: str):
+    with open(path, "rb") as handle:
+        payload = handle.read()
+    return {"audio": (io.BytesIO(payload), os.path.basename(path))}
+
+
+def run_user(user_id: int, args, fixtures: dict, stubs, recorder: StageRecorder, barrier):
+    """One simulated user: record → confirm transcript → generate, repeated."""
+    seed = args.seed + user_id
+    rng = random.Random(seed)
+    for stub in stubs:
+        stub.reseed(seed)
+    client = vars_app.app.test_client()
+    discard = StageRecorder()
+
+    try:
+        for iteration in range(args.warmup + args.iterations):
+            if iteration == args.warmup:
+                barrier.wait()
+            target = discard if iteration < args.warmup else recorder
+
+            if fixtures["audio"]:
+                audio_path = rng.choice(fixtures["audio"])
+                _timed(
+                    target,
+                    "transcribe",
+                    lambda: client.post(
+                        "/transcribe",
+                        data=_audio_upload(audio_path),
+                        content_type="multipart/form-data",
+                    ),
+                )
+
+            corpus = fixtures["add_transcripts"] if iteration == 0 else fixtures["transcripts"]
+            transcript = rng.choice(corpus)
+            _timed(
+                target,
+                "process-transcript",
+                lambda: client.post("/process-transcript", json={"transcript": transcript}),
+            )
+
+            _timed(target, "generate-resume", lambda: client.get("/generate-resume"))
+    except Exception:
+        # Release users waiting at the barrier instead of deadlocking the run.
+        barrier.abort()
+        raise
+
+
+def run_benchmark(args) -> dict:
+    with open(args.transcripts, "r", encoding="utf-8") as handle:
+        transcripts = json.load(handle)
+    add_transcripts = [text for text in transcripts if not StubLLM.is_modify(text)]
+    if not add_transcripts:
+        raise ValueError(f"{args.transcripts} has no 'add' transcripts to start a session with")
+
+    audio_files = sorted(glob.glob(args.audio))
+    if args.skip_transcribe:
+        audio_files = []
+    elif audio_files and shutil.which("ffmpeg") is None:
+        print("ffmpeg not found on PATH – skipping the transcribe stage.")
+        audio_files = []
+
+    fixtures = {"audio": audio_files, "transcripts": transcripts, "add_transcripts": add_transcripts}
+
+    asr = StubASR(transcripts, latency=args.asr_latency, jitter=args.jitter, seed=args.seed)
+    llm = StubLLM(latency=args.llm_latency, jitter=args.jitter, seed=args.seed)
+    restore = install(vars_app, asr, llm)
+
+    original_state = vars_app.resume_state
+    vars_app.resume_state = ResumeState()
+
+    recorder = StageRecorder()
+    if args.trace_memory:
+        tracemalloc.start()
+
+    measured = {}
+
+    def start_measuring():
+        # Runs once, when every user has finished warming up.
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        measured["rss_mb"] = _peak_rss_mb()
+        measured["start"] = time.perf_counter()
+
+    barrier = threading.Barrier(args.users, action=start_measuring)
+
+    # The app prints per-request diagnostics; keep the report readable.
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        with quiet:
+            with ThreadPoolExecutor(max_workers=args.users) as pool:
+                futures = [
+                    pool.submit(run_user, user_id, args, fixtures, (asr, llm), recorder, barrier)
+                    for user_id in range(args.users)
+                ]
+                for future in futures:
+                    future.result()
+            wall_time = time.perf_counter() - measured["start"]
+    finally:
+        restore()
+        vars_app.resume_state = original_state
+        traced_peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else None
+        if traced_peak is not None:
+            tracemalloc.stop()
+
+    peak_rss = _peak_rss_mb()
+    total_requests = sum(recorder.requests(stage) for stage in STAGES)
+    stages = {}
+    for stage in STAGES:
+        if not recorder.requests(stage):
+            continue
+        values = recorder.latencies[stage]
+        stages[stage] = {
+            "requests": recorder.requests(stage),
+            "rejected": recorder.rejected[stage],
+            "errors": recorder.errors[stage],
+            "p50_ms": percentile(values, 50) * 1000,
+            "p95_ms": percentile(values, 95) * 1000,
+            "p99_ms": percentile(values, 99) * 1000,
+        }
+
+    return {
+        "config": {
+            "users": args.users,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "asr_latency": args.asr_latency,
+            "llm_latency": args.llm_latency,
+            "jitter": args.jitter,
+            "seed": args.seed,
+            "audio_fixtures": len(audio_files),
+        },
+        "wall_time_s": wall_time,
+        "total_requests": total_requests,
+        "throughput_rps": total_requests / wall_time if wall_time else 0.0,
+        "peak_rss_mb": peak_rss,
+        "rss_growth_mb": peak_rss - measured["rss_mb"],
+        "peak_traced_mb": traced_peak / (1024 * 1024) if traced_peak is not None else None,
+        "stages": stages,
+    }
+
+
+# ── Reporting ─────────────────────────────────────────────────────────────────
+
+def print_report(report: dict):
+    config = report["config"]
+    print("=" * 72)
+    print(
+        f"Users: {config['users']}  Iterations: {config['iterations']}  "
+        f"ASR latency: {config['asr_latency']}s  LLM latency: {config['llm_latency']}s"
+    )
+    print(f"{'stage':<20}{'reqs':>6}{'4xx':>6}{'errs':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for stage, stats in report["stages"].items():
+        print(
+            f"{stage:<20}{stats['requests']:>6}{stats['rejected']:>6}{stats['errors']:>6}"
+            f"{stats['p50_ms']:>10.1f}{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}"
+        )
+    print("-" * 72)
+    print(
+        f"Total: {report['total_requests']} requests in {report['wall_time_s']:.2f}s "
+        f"({report['throughput_rps']:.2f} req/s)"
+    )
+    print(
+        f"Peak RSS: {report['peak_rss_mb']:.1f} MB "
+        f"(+{report['rss_growth_mb']:.1f} MB during the measured phase)"
+    )
+    if report["peak_traced_mb"] is not None:
+        print(f"Peak Python heap (tracemalloc): {report['peak_traced_mb']:.1f} MB")
+    print("=" * 72)
+
+
+def config_mismatches(report: dict, baseline: dict) -> list:
+    """Return the run settings that differ between `report` and `baseline`."""
+    current = report.get("config", {})
+    previous = baseline.get("config", {})
+    return [
+        f"{key}: baseline {previous.get(key)!r}, current {current.get(key)!r}"
+        for key in CONFIG_KEYS
+        if previous.get(key) != current.get(key)
+    ]
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float) -> list:
+    """Return a list of human-readable regressions beyond `tolerance`."""
+    regressions = []
+    for stage, stats in report["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if not previous:
+            continue
+        for key in ("p95_ms", "p99_ms"):
+            if previous[key] and stats[key] > previous[key] * (1 + tolerance):
+                regressions.append(
+                    f"{stage} {key}: {previous[key]:.1f} → {stats[key]:.1f}"
+                )
+        # Rejected (4xx) counts are reported but not gated: they reflect the
+        # shared session's state, not the cost of serving a request.
+        if stats["errors"] > previous.get("errors", 0):
+            regressions.append(
+                f"{stage} errors: {previous.get('errors', 0)} → {stats['errors']}"
+            )
+
+    for key in ("rss_growth_mb", "peak_traced_mb"):
+        previous_mb = baseline.get(key)
+        current_mb = report.get(key)
+        if previous_mb is None or current_mb is None:
+            continue
+        if current_mb > previous_mb * (1 + tolerance) + MEMORY_SLACK_MB:
+            regressions.append(f"{key}: {previous_mb:.1f} → {current_mb:.1f} MB")
+
+    previous_rps = baseline.get("throughput_rps")
+    if previous_rps and report["throughput_rps"] < previous_rps * (1 - tolerance):
+        regressions.append(
+            f"throughput: {previous_rps:.2f} → {report['throughput_rps']:.2f} req/s"
+        )
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--users", type=int, default=4, help="concurrent simulated users")
+    parser.add_argument("--iterations", type=int, default=5, help="measured flows per user")
+    parser.add_argument("--warmup", type=int, default=1, help="unmeasured flows per user before sampling")
+    parser.add_argument("--asr-latency", type=float, default=0.5, help="stub Whisper latency (s)")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="stub Groq latency per call (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="± latency jitter (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--audio", default=DEFAULT_AUDIO_GLOB, help="glob of .webm fixtures")
+    parser.add_argument("--transcripts", default=DEFAULT_TRANSCRIPTS, help="JSON list of transcripts")
+    parser.add_argument("--skip-transcribe", action="store_true", help="skip the ffmpeg/ASR stage")
+    parser.add_argument("--trace-memory", action="store_true", help="also report tracemalloc peak")
+    parser.add_argument("--save", help="write the JSON report to this path")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression ratio")
+    parser.add_argument("--verbose", action="store_true", help="keep the app's stdout logging")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report = run_benchmark(args)
+    print_report(report)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Report saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+        mismatches = config_mismatches(report, baseline)
+        if mismatches:
+            print("Baseline was recorded with different settings; refusing to compare:")
+            for line in mismatches:
+                print(f"  - {line}")
+            return 2
+
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("Regressions vs baseline:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("No regressions vs baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
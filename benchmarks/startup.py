@@ -0,0 +1,157 @@
+"""
+Startup profile for the VARS Flask app.
+
+Reports the slowest imports (via `python -X importtime`) and the
+time-to-first-request for the lightweight routes (`/` and `/save-resume`)
+in a fresh interpreter, and checks that no heavy ML/LLM dependency was
+imported to serve them.
+
+Run from the repository root:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --target-ms 1000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Probes measure cold startup, so the optional background warm-up stays off.
+_PROBE_ENV = {**os.environ, "VARS_WARMUP": "0"}
+
+# Must only be imported on first use or by the background warm-up.
+HEAVY_MODULES = ("torch", "transformers", "langchain_groq")
+
+_FIRST_REQUEST_SCRIPT = """\
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+client = app.app.test_client()
+timings = {"import_ms": (imported - start) * 1000}
+last = imported
+for label, call in (
+    ("/", lambda: client.get("/")),
+    ("/save-resume", lambda: client.post("/save-resume", json={"name": "Startup Probe"})),
+):
+    status = call().status_code
+    now = time.perf_counter()
+    timings[label] = {"status": status, "ms": (now - last) * 1000}
+    last = now
+heavy = [name for name in %r if name in sys.modules]
+print(json.dumps({"timings": timings, "heavy": heavy}))
+"""
+
+
+# ── Import-time profile ───────────────────────────────────────────────────────
+
+def profile_imports(module: str = "app") -> list:
+    """Return (module, self_us, cumulative_us) tuples, slowest cumulative first."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=_PROBE_ENV,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr}")
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header row
+        rows.append((parts[2].strip(), int(parts[0]), int(parts[1])))
+
+    return sorted(rows, key=lambda row: row[2], reverse=True)
+
+
+# ── Time to first request ─────────────────────────────────────────────────────
+
+def measure_first_request() -> dict:
+    """Spawn a fresh interpreter, import the app and hit the light routes once."""
+    script = _FIRST_REQUEST_SCRIPT % (HEAVY_MODULES,)
+    spawn = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        env=_PROBE_ENV,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - spawn) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"Startup probe failed:\n{proc.stderr}")
+
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["wall_ms"] = wall_ms
+    return result
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters to sample")
+    parser.add_argument("--top", type=int, default=15, help="slowest imports to list")
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=1500.0,
+        help="max median process-spawn → first response time for the light routes",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    rows = profile_imports("app")
+    total_us = next((cumulative for name, _, cumulative in rows if name == "app"), 0)
+    print("=" * 72)
+    print(f"Import profile for app (total {total_us / 1000:.1f} ms)")
+    print(f"{'module':<48}{'self ms':>12}{'cumul ms':>12}")
+    for name, self_us, cumulative_us in rows[: args.top]:
+        print(f"{name:<48}{self_us / 1000:>12.1f}{cumulative_us / 1000:>12.1f}")
+
+    samples = [measure_first_request() for _ in range(max(args.runs, 1))]
+    wall = statistics.median(sample["wall_ms"] for sample in samples)
+    imported = statistics.median(sample["timings"]["import_ms"] for sample in samples)
+    heavy = sorted({name for sample in samples for name in sample["heavy"]})
+
+    print("-" * 72)
+    print(f"Time to first request ({len(samples)} runs, median)")
+    print(f"  import app:          {imported:>8.1f} ms")
+    for route in ("/", "/save-resume"):
+        route_ms = statistics.median(sample["timings"][route]["ms"] for sample in samples)
+        status = samples[-1]["timings"][route]["status"]
+        print(f"  first {route:<14} {route_ms:>8.1f} ms  (HTTP {status})")
+    print(f"  spawn → responses:   {wall:>8.1f} ms  (target {args.target_ms:.0f} ms)")
+    print(f"  heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+    print("=" * 72)
+
+    failures = []
+    if wall > args.target_ms:
+        failures.append(f"time to first request {wall:.1f} ms exceeds target {args.target_ms:.0f} ms")
+    if heavy:
+        failures.append(f"heavy modules imported eagerly: {', '.join(heavy)}")
+
+    for route in ("/", "/save-resume"):
+        statuses = sorted({sample["timings"][route]["status"] for sample in samples})
+        if any(not 200 <= status < 300 for status in statuses):
+            failures.append(f"{route} answered HTTP {', '.join(map(str, statuses))}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
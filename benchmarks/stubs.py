@@ -0,0 +1,160 @@
+"""
+Deterministic stand-ins for the Whisper pipeline and the Groq client.
+
+Used by the benchmark harness so request handling can be measured without a
+GPU or a live GROQ_API_KEY. Both stubs sleep for a configurable latency
+(with seeded jitter) to mimic the real backends.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+from services import llm_service
+
+
+class _Latency:
+    """Latency generator: base ± jitter seconds, with one seeded RNG per thread.
+
+    Each simulated user calls `reseed()` on its own thread, so the delays a
+    user sees depend only on its seed, not on how threads are scheduled.
+    """
+
+    def __init__(self, base: float, jitter: float = 0.0, seed: int = 0):
+        self.base = max(base, 0.0)
+        self.jitter = max(jitter, 0.0)
+        self.seed = seed
+        self._local = threading.local()
+
+    def reseed(self, seed: int):
+        self._local.rng = random.Random(seed)
+
+    def sleep(self):
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            rng = self._local.rng = random.Random(self.seed)
+        offset = rng.uniform(-self.jitter, self.jitter) if self.jitter else 0.0
+        delay = max(self.base + offset, 0.0)
+        if delay:
+            time.sleep(delay)
+
+
+class StubASR:
+    """Callable matching the transformers ASR pipeline used by `/transcribe`."""
+
+    def __init__(self, transcripts: list, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        if not transcripts:
+            raise ValueError("StubASR needs at least one transcript")
+        self.transcripts = list(transcripts)
+        self._latency = _Latency(latency, jitter, seed)
+
+    def reseed(self, seed: int):
+        """Seed the latency RNG for the calling thread."""
+        self._latency.reseed(seed)
+
+    def __call__(self, audio_path, **kwargs):
+        self._latency.sleep()
+        # Same audio bytes always map to the same transcript.
+        index = os.path.getsize(audio_path) % len(self.transcripts)
+        return {"text": self.transcripts[index]}
+
+
+class StubLLM:
+    """Drop-in for `ChatGroq.invoke` returning canned but schema-valid JSON."""
+
+    _MODIFY_WORDS = ("change", "update", "remove", "delete", "rewrite", "rephrase", "edit")
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self._latency = _Latency(latency, jitter, seed)
+
+    def reseed(self, seed: int):
+        """Seed the latency RNG for the calling thread."""
+        self._latency.reseed(seed)
+
+    @classmethod
+    def is_modify(cls, transcript: str) -> bool:
+        """Whether the stub would classify `transcript` as a modify intent."""
+        lowered = transcript.lower()
+        return any(word in lowered for word in cls._MODIFY_WORDS)
+
+    def invoke(self, prompt: str):
+        self._latency.sleep()
+        return SimpleNamespace(content=json.dumps(self._respond(prompt)))
+
+    def _respond(self, prompt: str) -> dict:
+        body = _quoted_block(prompt)
+
+        if prompt.startswith(_prompt_head(llm_service._INTENT_PROMPT)):
+            return {"intent": "modify" if self.is_modify(body) else "add"}
+
+        if prompt.startswith(_prompt_head(llm_service._EXTRACTION_PROMPT)):
+            return _extract(body)
+
+        # Modification and refinement both echo the resume JSON they were given.
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError:
+            return {}
+
+
+def _prompt_head(template: str) -> str:
+    return template.split("\n", 1)[0]
+
+
+def _quoted_block(prompt: str) -> str:
+    """Return the first \"\"\"-delimited block of a prompt (the user payload)."""
+    parts = prompt.split('"""')
+    return parts[1].strip() if len(parts) >= 3 else ""
+
+
+def _proper_nouns(transcript: str) -> list:
+    """Capitalised words that are not just capitalised for starting a sentence."""
+    nouns = []
+    sentence_start = True
+    for raw in transcript.split():
+        word = raw.strip(".,!?")
+        if word and word[:1].isupper() and not sentence_start and word != "I":
+            nouns.append(word)
+        sentence_start = raw.endswith((".", "!", "?"))
+    return nouns
+
+
+def _extract(transcript: str) -> dict:
+    capitalised = _proper_nouns(transcript)
+    return {
+        "name": " ".join(capitalised[:2]) or None,
+        "email": None,
+        "phone": None,
+        "linkedin": None,
+        "github": None,
+        "summary": transcript[:200] or None,
+        "education": [],
+        "skills": capitalised[2:8],
+        "experience": [
+            {
+                "company": capitalised[-1] if capitalised else "Company",
+                "role": "Engineer",
+                "duration": "Jan 2021 - Present",
+                "bullets": [transcript[:120]],
+            }
+        ],
+        "projects": [],
+    }
+
+
+def install(app_module, asr: StubASR, llm: StubLLM):
+    """Swap the real backends for the stubs; returns a callable that restores them."""
+    original_get_model = app_module.get_model
+    original_llm = llm_service._llm
+
+    app_module.get_model = lambda: asr
+    llm_service._llm = llm
+
+    def restore():
+        app_module.get_model = original_get_model
+        llm_service._llm = original_llm
+
+    return restore
@@ -4,19 +4,17 @@ LLM Service – Groq LLaMA integration for resume extraction & refinement.
 
 import json
 import os
+import threading
 
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
 
 load_dotenv()
 
 _MODEL = "llama-3.1-8b-instant"
 
-_llm = ChatGroq(
-    model=_MODEL,
-    api_key=os.environ.get("GROQ_API_KEY"),
-    temperature=0.2,
-)
+# Built on first use so importing this module stays cheap.
+_llm = None
+_llm_lock = threading.Lock()
 
 # ── Prompt Templates ──────────────────────────────────────────────────────────
 
@@ -148,6 +146,24 @@ Input JSON:
 
 # ── Helper ────────────────────────────────────────────────────────────────────
 
+def _get_llm():
+    """Return the shared Groq client, importing and building it on first call."""
+    global _llm
+
+    if _llm is None:
+        with _llm_lock:
+            if _llm is None:
+                from langchain_groq import ChatGroq
+
+                _llm = ChatGroq(
+                    model=_MODEL,
+                    api_key=os.environ.get("GROQ_API_KEY"),
+                    temperature=0.2,
+                )
+
+    return _llm
+
+
 def _parse_json(text: str) -> dict:
     """Strip wrappers and parse the best JSON object from model output."""
     cleaned = text.strip()
@@ -198,10 +214,15 @@ def _parse_json(text: str) -> dict:
 
 # ── Public API ────────────────────────────────────────────────────────────────
 
+def warm_up() -> None:
+    """Build the Groq client ahead of the first request."""
+    _get_llm()
+
+
 def classify_intent(transcript: str) -> str:
     """Classify whether the user wants to ADD content or MODIFY existing data."""
     prompt = _INTENT_PROMPT.format(transcript=transcript)
-    response = _llm.invoke(prompt)
+    response = _get_llm().invoke(prompt)
     result = _parse_json(response.content)
     intent = result.get("intent", "add").lower()
     return intent if intent in ("add", "modify") else "add"
@@ -210,7 +231,7 @@ def classify_intent(transcript: str) -> str:
 def extract_resume_data(transcript: str) -> dict:
     """Stage 1 – extract structured resume data from a raw transcript."""
     prompt = _EXTRACTION_PROMPT.format(transcript=transcript)
-    response = _llm.invoke(prompt)
+    response = _get_llm().invoke(prompt)
     return _parse_json(response.content)
 
 
@@ -220,12 +241,12 @@ def modify_resume_data(current_data: dict, instruction: str) -> dict:
         data=json.dumps(current_data, indent=2),
         instruction=instruction,
     )
-    response = _llm.invoke(prompt)
+    response = _get_llm().invoke(prompt)
     return _parse_json(response.content)
 
 
 def refine_resume_data(data: dict) -> dict:
     """Stage 2 – professionally refine existing resume data."""
     prompt = _REFINEMENT_PROMPT.format(data=json.dumps(data, indent=2))
-    response = _llm.invoke(prompt)
+    response = _get_llm().invoke(prompt)
     return _parse_json(response.content)
@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+from benchmarks.load_test import compare_to_baseline, config_mismatches, percentile
+from benchmarks.stubs import StubLLM
+from services import llm_service
+
+
+RESUME = {"name": "Arjun Menon", "skills": ["Python"], "experience": []}
+
+
+def _report(p95=100.0, p99=120.0, rps=10.0, rss=50.0, traced=None, errors=0, rejected=0, **config):
+    return {
+        "config": {
+            "users": 4,
+            "iterations": 5,
+            "warmup": 1,
+            "asr_latency": 0.5,
+            "llm_latency": 0.2,
+            "jitter": 0.0,
+            "seed": 0,
+            "audio_fixtures": 4,
+            **config,
+        },
+        "throughput_rps": rps,
+        "rss_growth_mb": rss,
+        "peak_traced_mb": traced,
+        "stages": {
+            "process-transcript": {
+                "p95_ms": p95,
+                "p99_ms": p99,
+                "errors": errors,
+                "rejected": rejected,
+            }
+        },
+    }
+
+
+# ── StubLLM routing ───────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize(
+    "transcript, intent",
+    [
+        ("Please change my role to Lead Engineer.", "modify"),
+        ("Remove Docker from my skills.", "modify"),
+        ("I worked at Infosys from 2019 to 2022.", "add"),
+    ],
+)
+def test_stub_llm_classifies_intent(transcript, intent):
+    prompt = llm_service._INTENT_PROMPT.format(transcript=transcript)
+    assert StubLLM()._respond(prompt) == {"intent": intent}
+
+
+def test_stub_llm_extracts_resume_schema():
+    prompt = llm_service._EXTRACTION_PROMPT.format(
+        transcript="My name is Arjun Menon. I know Python and Docker. I worked at Infosys."
+    )
+    result = StubLLM()._respond(prompt)
+
+    assert set(result) == {
+        "name", "email", "phone", "linkedin", "github", "summary",
+        "education", "skills", "experience", "projects",
+    }
+    assert result["name"] == "Arjun Menon"
+    assert result["skills"] == ["Python", "Docker", "Infosys"]
+    assert isinstance(result["experience"], list)
+    assert result["experience"][0]["company"] == "Infosys"
+
+
+def test_stub_llm_echoes_data_for_refinement_and_modification():
+    data = json.dumps(RESUME, indent=2)
+    refine = llm_service._REFINEMENT_PROMPT.format(data=data)
+    modify = llm_service._MODIFICATION_PROMPT.format(data=data, instruction="Remove Python")
+
+    assert StubLLM()._respond(refine) == RESUME
+    assert StubLLM()._respond(modify) == RESUME
+
+
+def test_stub_llm_invoke_returns_json_content():
+    prompt = llm_service._INTENT_PROMPT.format(transcript="Delete my summary")
+    assert json.loads(StubLLM().invoke(prompt).content) == {"intent": "modify"}
+
+
+# ── percentile ────────────────────────────────────────────────────────────────
+
+def test_percentile_nearest_rank():
+    values = [10, 1, 9, 2, 8, 3, 7, 4, 6, 5]
+    assert percentile(values, 50) == 5
+    assert percentile(values, 95) == 10
+    assert percentile(values, 99) == 10
+    assert percentile(values, 0) == 1
+
+
+def test_percentile_edge_cases():
+    assert percentile([], 95) == 0.0
+    assert percentile([0.25], 50) == 0.25
+
+
+# ── Baseline comparison ───────────────────────────────────────────────────────
+
+def test_compare_within_tolerance_has_no_regressions():
+    baseline = _report()
+    current = _report(p95=119.0, p99=143.0, rps=8.1, rss=60.0, rejected=3)
+    assert compare_to_baseline(current, baseline, 0.2) == []
+
+
+def test_compare_flags_latency_throughput_and_counts():
+    baseline = _report()
+    current = _report(p95=121.0, rps=7.9, errors=1, rejected=2)
+    regressions = compare_to_baseline(current, baseline, 0.2)
+
+    assert any(line.startswith("process-transcript p95_ms") for line in regressions)
+    assert not any(line.startswith("process-transcript p99_ms") for line in regressions)
+    assert any(line.startswith("process-transcript errors") for line in regressions)
+    assert not any("rejected" in line for line in regressions)
+    assert any(line.startswith("throughput") for line in regressions)
+
+
+def test_compare_flags_memory_growth():
+    baseline = _report(rss=10.0, traced=10.0)
+    current = _report(rss=13.5, traced=13.5)
+    regressions = compare_to_baseline(current, baseline, 0.2)
+
+    assert any(line.startswith("rss_growth_mb") for line in regressions)
+    assert any(line.startswith("peak_traced_mb") for line in regressions)
+
+
+def test_compare_memory_allows_absolute_slack():
+    # 0.2 → 0.9 MB is +350% but inside the 1 MB slack.
+    assert compare_to_baseline(_report(rss=0.9), _report(rss=0.2), 0.2) == []
+
+
+def test_compare_skips_untraced_memory():
+    assert compare_to_baseline(_report(traced=None), _report(traced=10.0), 0.2) == []
+
+
+def test_config_mismatches():
+    assert config_mismatches(_report(), _report()) == []
+
+    mismatches = config_mismatches(_report(users=2), _report(users=8))
+    assert mismatches == ["users: baseline 8, current 2"]
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import app as vars_app
+from benchmarks.startup import HEAVY_MODULES, REPO_ROOT
+from services import llm_service
+
+
+def test_importing_app_skips_heavy_modules():
+    script = (
+        "import json, sys\n"
+        "import app\n"
+        f"print(json.dumps([name for name in {HEAVY_MODULES!r} if name in sys.modules]))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=REPO_ROOT,
+        env={**os.environ, "VARS_WARMUP": "0"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(proc.stdout.strip().splitlines()[-1]) == []
+
+
+def test_get_llm_builds_client_once(monkeypatch):
+    langchain_groq = pytest.importorskip("langchain_groq")
+    built = []
+
+    class FakeChatGroq:
+        def __init__(self, **kwargs):
+            built.append(kwargs)
+
+    monkeypatch.setattr(langchain_groq, "ChatGroq", FakeChatGroq)
+    monkeypatch.setattr(llm_service, "_llm", None)
+
+    clients = []
+    threads = [threading.Thread(target=lambda: clients.append(llm_service._get_llm())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert built[0]["model"] == llm_service._MODEL
+    assert all(client is clients[0] for client in clients)
+
+
+def test_start_warmup_runs_each_step_and_only_once(monkeypatch):
+    calls = []
+
+    def failing_get_model():
+        calls.append("whisper")
+        raise RuntimeError("no GPU")
+
+    monkeypatch.setattr(vars_app, "get_model", failing_get_model)
+    monkeypatch.setattr(llm_service, "warm_up", lambda: calls.append("groq"))
+    monkeypatch.setattr(vars_app, "_warmup_thread", None)
+
+    thread = vars_app.start_warmup()
+    thread.join(timeout=5)
+
+    assert calls == ["whisper", "groq"]
+    assert vars_app.start_warmup() is thread
+    assert calls == ["whisper", "groq"]